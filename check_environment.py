@@ -5,9 +5,18 @@
 运行此脚本以验证环境配置和文件可用性
 """
 
+import importlib.util
 import os
 import sys
 
+try:
+    import importlib.metadata as importlib_metadata
+except ImportError:  # Python 3.7: 需要安装 importlib_metadata 才能读取版本号
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
+
 def check_python_version():
     """检查Python版本"""
     print("=" * 60)
@@ -30,29 +39,19 @@ def check_dependencies():
     
     all_ok = True
     
-    # 检查pandas
-    try:
-        import pandas as pd
-        print(f"✓ pandas: {pd.__version__}")
-    except ImportError:
-        print("✗ pandas 未安装 - 运行: pip install pandas")
-        all_ok = False
-    
-    # 检查numpy
-    try:
-        import numpy as np
-        print(f"✓ numpy: {np.__version__}")
-    except ImportError:
-        print("✗ numpy 未安装 - 运行: pip install numpy")
-        all_ok = False
-    
-    # 检查openpyxl
-    try:
-        import openpyxl
-        print(f"✓ openpyxl: {openpyxl.__version__}")
-    except ImportError:
-        print("✗ openpyxl 未安装 - 运行: pip install openpyxl")
-        all_ok = False
+    # 只查找模块位置并读取安装元数据，不真正导入 (导入pandas本身就要数百毫秒)
+    for name in ("pandas", "numpy", "openpyxl"):
+        if importlib.util.find_spec(name) is None:
+            print(f"✗ {name} 未安装 - 运行: pip install {name}")
+            all_ok = False
+            continue
+        version = "未知版本"
+        if importlib_metadata is not None:
+            try:
+                version = importlib_metadata.version(name)
+            except importlib_metadata.PackageNotFoundError:
+                pass
+        print(f"✓ {name}: {version}")
     
     return all_ok
 
@@ -73,21 +72,40 @@ def check_files():
         ("The 2025 AI Index Report/1. Research and Development", "Stanford AI Index 文件夹"),
     ]
     
+    # 按所在目录分组，每个目录只扫描一次；scandir的条目自带文件类型，无需逐个stat
+    dir_entries = {}
+    for file_path, _ in required_files:
+        parent = os.path.dirname(file_path) or "."
+        if parent not in dir_entries:
+            try:
+                with os.scandir(parent) as it:
+                    dir_entries[parent] = {entry.name: entry for entry in it}
+            except OSError:
+                dir_entries[parent] = {}
+
     all_ok = True
     for file_path, description in required_files:
-        exists = os.path.exists(file_path)
+        entry = dir_entries[os.path.dirname(file_path) or "."].get(os.path.basename(file_path))
+        # 名称不完全一致时按文件系统自身的规则再确认 (Windows/macOS上不区分大小写)
+        exists = entry is not None or os.path.exists(file_path)
         status = "✓" if exists else "✗"
         print(f"{status} {description}")
         print(f"   路径: {file_path}")
         
         if exists:
-            if os.path.isdir(file_path):
+            if entry is None:
+                is_dir = os.path.isdir(file_path)
+            else:
+                is_dir = entry.is_dir()
+            if is_dir:
                 # 如果是文件夹，统计CSV文件数量
-                csv_count = len([f for f in os.listdir(file_path) if f.endswith('.csv')])
+                with os.scandir(file_path) as it:
+                    csv_count = sum(1 for e in it if e.name.endswith('.csv'))
                 print(f"   (包含 {csv_count} 个CSV文件)")
             else:
                 # 如果是文件，显示大小
-                size_mb = os.path.getsize(file_path) / (1024 * 1024)
+                size = entry.stat().st_size if entry is not None else os.path.getsize(file_path)
+                size_mb = size / (1024 * 1024)
                 print(f"   (大小: {size_mb:.2f} MB)")
         else:
             all_ok = False
@@ -124,8 +142,13 @@ def test_file_reading():
         test_file = "Tortoise_核心得分.xlsx"
         if os.path.exists(test_file):
             print(f"\n正在测试读取: {test_file}")
-            df = pd.read_excel(test_file)
-            print(f"✓ 成功读取!")
+            # 安装了python-calamine时使用更快的calamine引擎 (需要 pandas >= 2.2)
+            engine = None
+            if importlib.util.find_spec("python_calamine") is not None and \
+                    tuple(int(x) for x in pd.__version__.split('.')[:2]) >= (2, 2):
+                engine = "calamine"
+            df = pd.read_excel(test_file, engine=engine)
+            print(f"✓ 成功读取! (引擎: {engine or '默认'})")
             print(f"   形状: {df.shape} (行数 × 列数)")
             print(f"   列名: {df.columns.tolist()[:5]}..." if len(df.columns) > 5 else f"   列名: {df.columns.tolist()}")
             return True
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CSV读取辅助函数 - 供主脚本和预览/测试脚本共用
+只依赖pandas和numpy (pyarrow可选)
+"""
+
+import numpy as np
+import pandas as pd
+
+# 读取逻辑的版本: 修改 read_csv_fast 等会改变读取结果的代码时加一
+# 主脚本的结果缓存签名包含这个版本号 (以及本文件的修改时间和大小)
+READER_VERSION = 2
+
+# 可选: pyarrow (多线程CSV解析)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+def _pyarrow_only_columns(df):
+    """
+    检查pyarrow引擎的结果中与C引擎不一致的列，返回 (是否有bytes列, 日期/时间列的列名)
+    """
+    kinds = {i: pd.api.types.infer_dtype(df.iloc[:, i], skipna=True)
+             for i in np.flatnonzero(df.dtypes == object)}
+    has_bytes = 'bytes' in kinds.values()
+    date_cols = [col for i, col in enumerate(df.columns)
+                 if kinds.get(i) in ('date', 'datetime', 'time')
+                 or pd.api.types.is_datetime64_any_dtype(df.dtypes.iloc[i])]
+    return has_bytes, date_cols
+
+def read_csv_fast(filepath, **kwargs):
+    """
+    读取CSV，优先使用pyarrow多线程解析引擎，不支持时回退到默认C引擎
+    结果的列名和类型与C引擎一致
+    """
+    if HAS_PYARROW:
+        try:
+            df = pd.read_csv(filepath, engine='pyarrow', **kwargs)
+            # 有无法按该编码解码的字节时pyarrow不报错，而是返回bytes列:
+            # 这种情况交给C引擎重新解析，由它抛出UnicodeDecodeError，调用方据此换编码
+            has_bytes, date_cols = _pyarrow_only_columns(df)
+            # 调用方自己指定了dtype时不再合并类型，交给C引擎
+            if not has_bytes and not (date_cols and 'dtype' in kwargs):
+                if date_cols:
+                    # pyarrow会把ISO格式的日期/时间列解析为日期和时间戳，C引擎保留为字符串:
+                    # 这些列按字符串重新读取 (后续的 pd.to_numeric 才会得到NaN而不是时间戳的整数值)
+                    df = pd.read_csv(filepath, engine='pyarrow',
+                                     dtype={col: str for col in date_cols}, **kwargs)
+                # 与C引擎一致: 空表头命名为 "Unnamed: i"
+                df.columns = [f"Unnamed: {i}" if col == '' else col for i, col in enumerate(df.columns)]
+                return df
+        except Exception:
+            pass
+    # C引擎通过内存映射读取文件，省去一次把整个文件复制到用户态缓冲区的开销
+    return pd.read_csv(filepath, memory_map=True, **kwargs)
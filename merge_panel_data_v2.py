@@ -8,10 +8,65 @@
 import pandas as pd
 import numpy as np
 import os
+import re
+import codecs
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import io
+import mmap
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import warnings
 warnings.filterwarnings('ignore')
 
+import csv_utils
+from csv_utils import read_csv_fast
+
+# 可选: Rust实现的calamine引擎 (需要 pandas >= 2.2 和 python-calamine)
+try:
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = tuple(int(x) for x in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    HAS_CALAMINE = False
+
+# 可选: pyarrow (用于Parquet缓存和多线程CSV解析)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# 可选: polars (在Rust中完成国家名称列的字符串标准化，需要 polars >= 1.0 和 pyarrow)
+try:
+    import polars as pl
+    USE_POLARS = HAS_PYARROW and tuple(int(x) for x in pl.__version__.split('.')[:2]) >= (1, 0)
+except ImportError:
+    USE_POLARS = False
+
+# 可选: 编码检测库 (charset-normalizer 或 chardet)
+try:
+    from charset_normalizer import from_bytes as _charset_from_bytes
+except ImportError:
+    _charset_from_bytes = None
+try:
+    import chardet
+except ImportError:
+    chardet = None
+
+# 可选: xxhash (比blake2b更快的文件内容哈希)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# 可选: numba (JIT编译的线性插值内核)
+# 只检查是否安装，数据量足够大需要用到时才导入 (导入numba本身就要约0.25秒)
+HAS_NUMBA = importlib.util.find_spec('numba') is not None
+
 # =========================
 # 1. 配置和辅助函数
 # =========================
@@ -22,6 +77,14 @@ TARGET_COUNTRIES = [
     "South Korea", "France", "Canada", "India", "United Arab Emirates"
 ]
 
+# 目标国家集合 (用于成员判断)
+TARGET_COUNTRY_SET = frozenset(TARGET_COUNTRIES)
+
+# 国家列的分类类型 (类别按字母排序，排序结果与字符串列一致)
+COUNTRY_DTYPE = pd.CategoricalDtype(categories=sorted(TARGET_COUNTRIES))
+# 年份列的整数类型 (年份范围远小于int16上限)
+YEAR_DTYPE = 'int16'
+
 # 国家名称映射字典（用于标准化各数据源的国家名称）
 COUNTRY_NAME_MAPPING = {
     # 中国的各种表述
@@ -82,64 +145,537 @@ COUNTRY_NAME_MAPPING = {
     "阿联酋": "United Arab Emirates",
 }
 
+# 标准名称及别名 -> 标准名称，用于精确匹配
+_STD_MAP = {**{c: c for c in TARGET_COUNTRIES}, **COUNTRY_NAME_MAPPING}
+
+# 小写名称 -> 标准名称，用于精确匹配（不区分大小写）
+LOWER_MAP = {
+    **{k.lower(): v for k, v in COUNTRY_NAME_MAPPING.items()},
+    **{c.lower(): c for c in TARGET_COUNTRIES},
+}
+
+# 模糊匹配用的别名列表，顺序与COUNTRY_NAME_MAPPING一致（靠前的优先）
+_FUZZY_VARIANTS = [(k.lower(), v) for k, v in COUNTRY_NAME_MAPPING.items()]
+
+# 所有别名拼接成一个字符串，用一次str.find判断"名称是否为某个别名的一部分"
+_VARIANT_BLOB = '\x00'.join(v for v, _ in _FUZZY_VARIANTS)
+_VARIANT_STARTS = np.cumsum([0] + [len(v) + 1 for v, _ in _FUZZY_VARIANTS[:-1]])
+
+# 可选: Aho-Corasick自动机，一次扫描找出名称中包含的所有别名
+try:
+    import ahocorasick
+    _COUNTRY_AUTOMATON = ahocorasick.Automaton()
+    for _i, (_variant, _) in enumerate(_FUZZY_VARIANTS):
+        _COUNTRY_AUTOMATON.add_word(_variant, _i)
+    _COUNTRY_AUTOMATON.make_automaton()
+except ImportError:
+    _COUNTRY_AUTOMATON = None
+
+def _fuzzy_country_match(name):
+    """
+    模糊匹配（部分匹配）: 别名包含于名称中，或名称包含于别名中
+    name 须为已去空格的小写字符串；多个别名匹配时取COUNTRY_NAME_MAPPING中最靠前的
+    """
+    if not name:
+        return None
+
+    if _COUNTRY_AUTOMATON is not None:
+        hits = [i for _, i in _COUNTRY_AUTOMATON.iter(name)]
+    else:
+        hits = [i for i, (variant, _) in enumerate(_FUZZY_VARIANTS) if variant in name]
+
+    pos = _VARIANT_BLOB.find(name)
+    if pos >= 0:
+        hits.append(int(np.searchsorted(_VARIANT_STARTS, pos, side='right')) - 1)
+
+    return _FUZZY_VARIANTS[min(hits)][1] if hits else None
+
+@functools.lru_cache(maxsize=4096)
+def _standardize_country_key(key):
+    """按小写名称查找标准名称（结果缓存，同一名称在各文件中反复出现）"""
+    # 直接匹配（标准名称或映射字典）
+    if key in LOWER_MAP:
+        return LOWER_MAP[key]
+
+    return _fuzzy_country_match(key)
+
 def standardize_country_name(country_name):
     """标准化国家名称"""
     if pd.isna(country_name):
         return None
-    
-    country_name = str(country_name).strip()
-    
-    # 直接匹配
-    if country_name in TARGET_COUNTRIES:
-        return country_name
-    
-    # 使用映射字典
-    if country_name in COUNTRY_NAME_MAPPING:
-        return COUNTRY_NAME_MAPPING[country_name]
-    
-    # 模糊匹配（部分匹配）
-    for variant, standard in COUNTRY_NAME_MAPPING.items():
-        if variant.lower() in country_name.lower() or country_name.lower() in variant.lower():
-            return standard
-    
-    return None
+
+    return _standardize_country_key(str(country_name).strip().lower())
+
+def standardize_country_series(series):
+    """
+    向量化的国家名称标准化 (Series版本的standardize_country_name)
+    先区分大小写精确匹配，未命中的再转小写匹配，最后只对剩余的唯一值做模糊匹配
+    """
+    names = series.astype('string').str.strip()
+    std = names.map(_STD_MAP).astype(object)
+
+    miss = std.isna() & names.notna()
+    if miss.any():
+        keys = names[miss].str.lower()
+        lowered = keys.map(LOWER_MAP).astype(object)
+
+        residual = keys[lowered.isna()].unique()
+        if len(residual) > 0:
+            fuzzy = {key: _standardize_country_key(key) for key in residual}
+            lowered = lowered.fillna(keys.map(fuzzy))
+
+        std[miss] = lowered
+
+    return std
+
+def _standardize_country_series_polars(series):
+    """
+    standardize_country_series 的polars版本: 去空格、精确匹配和小写匹配在polars中完成，
+    只有剩余的唯一值回到Python做模糊匹配
+    """
+    names = pl.from_pandas(series.astype('string')).str.strip_chars()
+    keys = names.str.to_lowercase()
+    std = names.replace_strict(_STD_MAP, default=None, return_dtype=pl.String)
+    std = std.fill_null(keys.replace_strict(LOWER_MAP, default=None, return_dtype=pl.String))
+
+    residual = keys.filter(std.is_null() & keys.is_not_null()).unique().to_list()
+    if residual:
+        fuzzy = {key: _standardize_country_key(key) for key in residual}
+        std = std.fill_null(keys.replace_strict(fuzzy, default=None, return_dtype=pl.String))
+
+    return pd.Series(std.to_list(), index=series.index, dtype=object)
 
 def filter_target_countries(df, country_column='Country'):
-    """筛选目标国家"""
-    df[country_column] = df[country_column].apply(standardize_country_name)
-    df = df[df[country_column].isin(TARGET_COUNTRIES)]
+    """
+    筛选目标国家，国家列标准化后转为分类类型 (COUNTRY_DTYPE)
+    非目标国家在转换时变为缺失值，一次notna判断即可筛选
+    """
+    standardize = _standardize_country_series_polars if USE_POLARS else standardize_country_series
+    countries = standardize(df[country_column]).astype(COUNTRY_DTYPE)
+    mask = countries.notna()
+    df = df[mask]
+    df[country_column] = countries[mask]
     return df
 
-def safe_read_file(filepath, file_type='auto'):
+# 列名识别规则: 角色 -> 正则 (不区分大小写)
+COL_PATTERNS = {
+    'country': re.compile(r'ref_area|country|国家|entity|area', re.I),
+    'year': re.compile(r'time_period|^time$|year|年', re.I),
+    'value': re.compile(r'obs_value|^value$', re.I),
+    'measure': re.compile(r'measure', re.I),
+    'unit': re.compile(r'unit', re.I),
+}
+
+def identify_columns(columns, patterns=COL_PATTERNS):
+    """
+    根据列名识别关键列，返回 {角色: 列名}，未找到的角色为None
+    按顺序遍历列，每列归入第一个与之匹配且尚未确定的角色
+    """
+    found = dict.fromkeys(patterns)
+    for col in columns:
+        col_str = str(col)
+        for role, pattern in patterns.items():
+            if found[role] is None and pattern.search(col_str):
+                found[role] = col
+                break
+    return found
+
+def select_columns(columns, found):
+    """按文件中的原始顺序返回identify_columns识别出的列，用作读取时的usecols"""
+    wanted = {col for col in found.values() if col is not None}
+    return [col for col in columns if col in wanted]
+
+# 进程内打开的工作簿: 路径 -> (修改时间, 工作簿)，最多保留 MAX_OPEN_WORKBOOKS 个
+_OPEN_WORKBOOKS = {}
+MAX_OPEN_WORKBOOKS = 16
+
+def close_workbook(filepath):
+    """关闭缓存的工作簿并释放文件句柄 (Windows上打开的文件无法被其他程序修改)"""
+    entry = _OPEN_WORKBOOKS.pop(filepath, None)
+    if entry is not None:
+        entry[1].close()
+
+def open_workbook(filepath):
+    """
+    返回缓存的工作簿对象 (calamine的ExcelFile或openpyxl只读工作簿，按路径和修改时间区分)
+    同一文件先读表头再读数据时，工作簿的zip解压和结构解析只做一次；
+    文件被修改或缓存已满时，旧的工作簿立即关闭，而不是等垃圾回收
+    """
+    mtime = os.path.getmtime(filepath)
+    entry = _OPEN_WORKBOOKS.get(filepath)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+    close_workbook(filepath)
+    while len(_OPEN_WORKBOOKS) >= MAX_OPEN_WORKBOOKS:
+        close_workbook(next(iter(_OPEN_WORKBOOKS)))
+    
+    if HAS_CALAMINE:
+        wb = pd.ExcelFile(filepath, engine='calamine')
+    else:
+        from openpyxl import load_workbook
+        wb = load_workbook(filepath, read_only=True, data_only=True)
+    _OPEN_WORKBOOKS[filepath] = (mtime, wb)
+    return wb
+
+def _read_excel_openpyxl(filepath, sheet_name=0, nrows=None, usecols=None):
+    """
+    使用openpyxl只读模式读取工作表 (未安装calamine时的后备方案)
+    只读模式按行流式解析XML，内存占用约等于文件大小
+    """
+    from pandas.io.parsers import TextParser
+
+    wb = open_workbook(filepath)
+    ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+    # 只读模式下工作表记录的尺寸可能不准确 (同pandas的openpyxl读取器)
+    ws.reset_dimensions()
+
+    # 与pandas的openpyxl读取器一致: 空单元格记为空字符串，去掉每行末尾的空单元格
+    # (有格式但没有值的单元格也会出现在行中，不去掉会多出 "Unnamed: N" 列)
+    max_row = None if nrows is None else nrows + 1
+    data = []
+    last_row_with_data = -1
+    for row_number, row in enumerate(ws.iter_rows(max_row=max_row, values_only=True)):
+        row = ['' if v is None else v for v in row]
+        while row and row[-1] == '':
+            row.pop()
+        if row:
+            last_row_with_data = row_number
+        data.append(row)
+
+    # 去掉末尾的空行，其余各行补齐到最宽一行的长度
+    data = data[:last_row_with_data + 1]
+    if not data:
+        return pd.DataFrame()
+    max_width = max(len(row) for row in data)
+    data = [row + [''] * (max_width - len(row)) for row in data]
+
+    # 与pd.read_excel相同的表头处理和类型推断
+    return TextParser(data, header=0, usecols=usecols).read()
+
+def read_excel_sheet(filepath, sheet_name=0, nrows=None, usecols=None):
+    """读取Excel工作表，优先使用calamine引擎，否则使用openpyxl只读模式"""
+    if usecols is not None:
+        # 表头可能混有数字和字符串，用判断函数代替列名列表
+        wanted = set(usecols)
+        usecols = lambda col: col in wanted
+    if HAS_CALAMINE:
+        return open_workbook(filepath).parse(sheet_name=sheet_name, nrows=nrows, usecols=usecols)
+    return _read_excel_openpyxl(filepath, sheet_name, nrows=nrows, usecols=usecols)
+
+# 按文件内容索引的Parquet缓存目录 (文件改名、移动或复制后仍能命中)
+CONTENT_CACHE_DIR = Path.home() / '.cache' / 'panel_data'
+
+def file_digest(filepath, chunk_size=4 * 1024 * 1024):
+    """
+    计算文件内容的哈希，用作缓存键 (文件大小 + 开头和结尾各chunk_size字节；chunk_size=None时哈希整个文件)
+    通过mmap直接哈希文件页，不复制数据；优先使用xxh3_128，否则blake2b
+    """
+    h = xxhash.xxh3_128() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    size = os.path.getsize(filepath)
+    h.update(str(size).encode())
+    if size:
+        with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                if chunk_size is None:
+                    h.update(view)
+                else:
+                    h.update(view[:chunk_size])
+                    if size > chunk_size:
+                        h.update(view[max(chunk_size, size - chunk_size):])
+    return h.hexdigest()
+
+@functools.lru_cache(maxsize=64)
+def _content_digest(filepath, mtime, size):
+    """
+    源文件的内容哈希 (在进程内按路径、修改时间和大小缓存，同一文件的表头读取、数据读取和写缓存只计算一次)
+    .xlsx是zip格式，目录在文件末尾，任何修改都会改变开头或结尾，只哈希两端即可；
+    .xls 的中间可以原地修改而大小不变，必须哈希整个文件
+    """
+    chunk_size = None if filepath.lower().endswith('.xls') else 4 * 1024 * 1024
+    return file_digest(filepath, chunk_size=chunk_size)
+
+def content_digest(filepath):
+    """返回缓存的文件内容哈希"""
+    st = os.stat(filepath)
+    return _content_digest(filepath, st.st_mtime, st.st_size)
+
+def _find_parquet_cache(filepath):
+    """
+    查找可用的Parquet缓存路径，没有时返回None
+    先看旁边的缓存是否比源文件新，再按文件内容哈希查找；
+    内容缓存命中时复制到旁边，之后的读取不必再计算哈希
+    """
+    if not HAS_PYARROW:
+        return None
+    cache = filepath + '.parquet'
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(filepath):
+        return cache
+
+    content_cache = CONTENT_CACHE_DIR / f"{content_digest(filepath)}.parquet"
+    if not content_cache.exists():
+        return None
+    try:
+        shutil.copyfile(content_cache, cache)
+        return cache
+    except OSError:
+        return str(content_cache)
+
+def _write_parquet_cache(filepath, df):
+    """把解析结果写入旁边的缓存，并复制一份到内容缓存目录"""
+    cache = filepath + '.parquet'
+    try:
+        df.to_parquet(cache, compression='zstd')
+    except Exception:
+        # 混合类型的列等无法写入Parquet，不影响结果
+        if os.path.exists(cache):
+            os.remove(cache)
+        return
+    try:
+        CONTENT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cache, CONTENT_CACHE_DIR / f"{content_digest(filepath)}.parquet")
+    except OSError:
+        pass  # 内容缓存只是加速手段，写入失败不影响结果
+
+def read_excel_columns(filepath):
+    """只读取Excel第一个工作表的列名 (有缓存时只读取Parquet的schema)"""
+    cache = _find_parquet_cache(filepath)
+    if cache is not None:
+        try:
+            import pyarrow.parquet as pq
+            return pq.read_schema(cache).empty_table().to_pandas().columns.tolist()
+        except Exception:
+            pass  # 缓存损坏，改为读取表头
+    return read_excel_sheet(filepath, sheet_name=0, nrows=0).columns.tolist()
+
+def read_excel_cached(filepath, usecols=None):
+    """
+    读取Excel第一个工作表，并在旁边缓存为Parquet文件 (filepath + '.parquet')
+    缓存比源文件新、或内容缓存目录中有相同内容的文件时直接读取缓存，跳过Excel解析；
+    指定usecols时只读取这些列
+    """
+    if not HAS_PYARROW:
+        try:
+            return read_excel_sheet(filepath, sheet_name=0, usecols=usecols)
+        finally:
+            close_workbook(filepath)
+
+    cache = _find_parquet_cache(filepath)
+    if cache is not None:
+        try:
+            return pd.read_parquet(cache, columns=usecols)
+        except Exception:
+            pass  # 缓存损坏，重新解析
+
+    # 缓存整个工作表，之后不同的列组合都能直接读取缓存；
+    # 读完后关闭工作簿 (read_excel_columns读表头时打开的也是同一个)
+    try:
+        df = read_excel_sheet(filepath, sheet_name=0)
+    finally:
+        close_workbook(filepath)
+    _write_parquet_cache(filepath, df)
+    return df if usecols is None else df[usecols]
+
+# 常见编码，按顺序用文件样本验证 (gb2312是gbk的子集)
+CSV_ENCODINGS = ['utf-8', 'gbk']
+
+def detect_encoding(filepath, sample_size=64 * 1024):
+    """根据文件开头的样本判断编码，只读取一次样本而不是反复解析整个文件"""
+    with open(filepath, 'rb') as f:
+        sample = f.read(sample_size)
+
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    # 样本末尾可能截断多字节字符，不做final检查
+    for encoding in CSV_ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    # 都不是: 交给检测库判断，否则按ISO-8859-1读取（任何字节都能解码）
+    encoding = None
+    if _charset_from_bytes is not None:
+        best = _charset_from_bytes(sample).best()
+        encoding = best.encoding if best is not None else None
+    elif chardet is not None:
+        encoding = chardet.detect(sample)['encoding']
+    return encoding or 'iso-8859-1'
+
+def _resolve_file_type(filepath, file_type='auto'):
+    """根据扩展名判断文件类型"""
+    if file_type == 'auto':
+        if filepath.endswith('.csv'):
+            file_type = 'csv'
+        elif filepath.endswith(('.xlsx', '.xls')):
+            file_type = 'excel'
+    return file_type
+
+def read_file_columns(filepath, file_type='auto'):
+    """
+    只读取文件的表头，返回列名列表；读取失败时返回None
+    safe_read_file(columns_spec=...) 用它先识别需要的列，再只解析这些列
+    """
+    try:
+        if _resolve_file_type(filepath, file_type) == 'csv':
+            encoding = detect_encoding(filepath)
+            return pd.read_csv(filepath, encoding=encoding, encoding_errors='replace',
+                               nrows=0).columns.tolist()
+        else:
+            return read_excel_columns(filepath)
+    except Exception as e:
+        print(f"    ⚠️  读取文件失败: {e}")
+        return None
+
+def safe_read_file(filepath, file_type='auto', usecols=None, columns_spec=None):
     """
     安全读取文件，自动检测CSV或Excel格式
+    usecols: 只读取的列名列表 (默认读取全部列)
+    columns_spec: {角色: 正则}，格式同identify_columns。给定时先只读表头识别出这些列，
+                  再只解析识别出的列；完整的表头保存在 df.attrs['source_columns']
     """
+    if columns_spec is not None:
+        columns = read_file_columns(filepath, file_type)
+        if columns is None:
+            return None
+        df = safe_read_file(filepath, file_type,
+                            usecols=select_columns(columns, identify_columns(columns, columns_spec)))
+        if df is not None:
+            df.attrs['source_columns'] = columns
+        return df
+    
     try:
-        if file_type == 'auto':
-            if filepath.endswith('.csv'):
-                file_type = 'csv'
-            elif filepath.endswith(('.xlsx', '.xls')):
-                file_type = 'excel'
-        
-        if file_type == 'csv':
-            # 尝试多种编码
-            for encoding in ['utf-8', 'utf-8-sig', 'gbk', 'gb2312', 'iso-8859-1']:
+        if _resolve_file_type(filepath, file_type) == 'csv':
+            encoding = detect_encoding(filepath)
+            # 样本之后出现无法解码的字节: 依次尝试其余的常见编码
+            for candidate in [encoding] + [enc for enc in CSV_ENCODINGS if enc != encoding]:
                 try:
-                    return pd.read_csv(filepath, encoding=encoding)
-                except (UnicodeDecodeError, pd.errors.ParserError):
+                    return read_csv_fast(filepath, encoding=candidate, usecols=usecols)
+                except UnicodeDecodeError:
                     continue
-            # 如果都失败，尝试不指定编码
-            return pd.read_csv(filepath)
+            # 都无法完整解码时才替换无法解码的字符
+            return pd.read_csv(filepath, encoding=encoding, encoding_errors='replace',
+                               usecols=usecols, memory_map=True)
         else:
-            return pd.read_excel(filepath, sheet_name=0)
+            return read_excel_cached(filepath, usecols=usecols)
     except Exception as e:
         print(f"    ⚠️  读取文件失败: {e}")
         return None
 
+# 是否输出合并、插值等步骤的日志和完整的统计报告 (设置环境变量 PIPELINE_VERBOSE=0 关闭)
+# 关闭时警告和错误仍然输出，统计报告改为一张describe()汇总表；各数据源处理函数的日志不受影响
+VERBOSE = os.getenv('PIPELINE_VERBOSE', '1') == '1'
+
+def log(*args, **kwargs):
+    """输出处理日志，VERBOSE关闭时不输出"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+def report_exception(message):
+    """打印错误信息和当前异常的堆栈 (traceback只在出错时才导入)"""
+    print(message)
+    import traceback
+    traceback.print_exc()
+
+# 各数据源处理结果的缓存目录 (相对于工作目录)
+RESULT_CACHE_DIR = '.cache'
+
+# 结果缓存的格式版本: 处理结果的结构变化而代码签名覆盖不到时加一，使旧缓存全部失效
+RESULT_CACHE_VERSION = 1
+
+def _code_signature():
+    """
+    生成处理结果的代码和环境的签名:
+    本脚本及其导入的同目录模块的修改时间和大小 (拆分出的模块自动计入)，
+    以及影响解析结果的库版本和可选引擎 (安装或卸载calamine、polars等后缓存失效)
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    # csv_utils 即使从其他目录导入也计入
+    code_files = {os.path.abspath(__file__), os.path.abspath(csv_utils.__file__)}
+    for module in list(sys.modules.values()):
+        path = getattr(module, '__file__', None)
+        if path and os.path.dirname(os.path.abspath(path)) == script_dir:
+            code_files.add(os.path.abspath(path))
+    
+    engines = {
+        'pandas': pd,
+        'pyarrow': pyarrow if HAS_PYARROW else None,
+        'calamine': python_calamine if HAS_CALAMINE else None,
+        'polars': pl if USE_POLARS else None,
+        'charset_normalizer': sys.modules.get('charset_normalizer') if _charset_from_bytes is not None else None,
+        'chardet': chardet,
+    }
+    parts = [f"cache_version:{RESULT_CACHE_VERSION}", f"csv_reader_version:{csv_utils.READER_VERSION}"]
+    parts.extend(f"{name}:{getattr(module, '__version__', '?') if module is not None else None}"
+                 for name, module in engines.items())
+    parts.extend(f"{path}:{os.path.getmtime(path)}:{os.path.getsize(path)}" for path in sorted(code_files))
+    return parts
+
+def _source_signature(paths):
+    """
+    源文件签名: 每个存在的文件 (或文件夹内的文件) 的修改时间和大小
+    代码和环境的签名 (_code_signature) 也计入，处理逻辑或解析引擎变化后缓存自动失效
+    """
+    parts = _code_signature()
+    for path in paths:
+        if os.path.isdir(path):
+            with os.scandir(path) as it:
+                entries = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+            parts.extend(f"{e.path}:{e.stat().st_mtime}:{e.stat().st_size}" for e in entries)
+        elif os.path.exists(path):
+            parts.append(f"{path}:{os.path.getmtime(path)}:{os.path.getsize(path)}")
+    return '\n'.join(parts)
+
+def cache_df(name, *source_paths):
+    """
+    装饰器: 把数据源处理函数的结果缓存为 .cache/<name>.parquet
+    源文件的签名与 .cache/<name>.stamp 一致时直接读取缓存，跳过读取和处理源文件
+    空结果 (文件缺失或处理出错) 不缓存；未安装pyarrow时不使用缓存
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not HAS_PYARROW:
+                return func(*args, **kwargs)
+            
+            cache = os.path.join(RESULT_CACHE_DIR, f"{name}.parquet")
+            stamp = os.path.join(RESULT_CACHE_DIR, f"{name}.stamp")
+            signature = _source_signature(source_paths)
+            
+            if os.path.exists(cache) and os.path.exists(stamp):
+                try:
+                    with open(stamp, encoding='utf-8') as f:
+                        if f.read() == signature:
+                            df = pd.read_parquet(cache)
+                            # Parquet只保存出现过的类别，恢复完整的国家分类类型
+                            df['Country'] = df['Country'].astype(COUNTRY_DTYPE)
+                            print(f"源文件未变化，读取缓存 {cache}: {len(df)} 条记录")
+                            return df
+                except Exception:
+                    pass  # 缓存损坏，重新处理
+            
+            df = func(*args, **kwargs)
+            if len(df) > 0:
+                try:
+                    os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+                    df.to_parquet(cache)
+                    with open(stamp, 'w', encoding='utf-8') as f:
+                        f.write(signature)
+                except Exception:
+                    # 写入失败时删除不完整的缓存，不影响结果
+                    for path in (cache, stamp):
+                        if os.path.exists(path):
+                            os.remove(path)
+            return df
+        return wrapper
+    return decorator
+
 # =========================
 # 2. OECD MSTI 数据处理
 # =========================
 
+@cache_df('oecd_msti', "OECD_MSTI, 主要科技指标.csv", "OECD_MSTI, 主要科技指标.xlsx")
 def process_oecd_msti():
     """
     处理OECD MSTI数据 - 提取R&D支出和研究人员数据
@@ -157,34 +693,24 @@ def process_oecd_msti():
         return pd.DataFrame(columns=['Country', 'Year', 'GERD_Million_USD', 'Researchers'])
     
     try:
-        df = safe_read_file(filepath)
+        # 从OECD格式中提取关键列
+        # 格式: REF_AREA (国家代码), TIME_PERIOD (年份), MEASURE (指标), OBS_VALUE (值)
+        
+        # 先只读表头识别关键列，再只解析这些列
+        df = safe_read_file(filepath, columns_spec=COL_PATTERNS)
         if df is None:
             return pd.DataFrame(columns=['Country', 'Year', 'GERD_Million_USD', 'Researchers'])
         
-        print(f"  列数: {len(df.columns)}, 行数: {len(df)}")
+        columns = df.attrs.pop('source_columns')
+        cols = identify_columns(df.columns)
         
-        # 从OECD格式中提取关键列
-        # 格式: REF_AREA (国家代码), TIME_PERIOD (年份), MEASURE (指标), OBS_VALUE (值)
+        print(f"  列数: {len(columns)}, 行数: {len(df)}")
         
-        # 查找关键列
-        ref_area_col = None
-        time_col = None
-        measure_col = None
-        value_col = None
-        unit_col = None
-        
-        for col in df.columns:
-            col_str = str(col).upper()
-            if 'REF_AREA' in col_str or col_str == 'COUNTRY':
-                ref_area_col = col
-            elif 'TIME_PERIOD' in col_str or 'TIME' in col_str or col_str == 'YEAR':
-                time_col = col
-            elif 'MEASURE' in col_str:
-                measure_col = col
-            elif 'OBS_VALUE' in col_str or col_str == 'VALUE':
-                value_col = col
-            elif 'UNIT_MEASURE' in col_str or 'UNIT' in col_str:
-                unit_col = col
+        ref_area_col = cols['country']
+        time_col = cols['year']
+        measure_col = cols['measure']
+        value_col = cols['value']
+        unit_col = cols['unit']
         
         print(f"  识别的列: Country={ref_area_col}, Time={time_col}, Measure={measure_col}, Value={value_col}, Unit={unit_col}")
         
@@ -196,12 +722,17 @@ def process_oecd_msti():
         # G = GERD (Gross Domestic Expenditure on R&D)
         # T_RS = Total Researchers
         
+        # 先标准化并筛选目标国家，后续的指标/单位筛选和透视只处理目标国家的数据
+        df_rd = filter_target_countries(df, ref_area_col)
+        
+        if len(df_rd) == 0:
+            print(f"  ⚠️  筛选目标国家后无数据")
+            return pd.DataFrame(columns=['Country', 'Year', 'GERD_Million_USD', 'Researchers'])
+        
         if measure_col:
             # 筛选GERD和研究人员数据
-            df_rd = df[df[measure_col].astype(str).isin(['G', 'T_RS'])].copy()
+            df_rd = df_rd[df_rd[measure_col].astype(str).isin(['G', 'T_RS'])]
             print(f"  筛选GERD和研究人员后: {len(df_rd)} 行")
-        else:
-            df_rd = df.copy()
         
         if len(df_rd) == 0:
             print(f"  ⚠️  未找到R&D相关指标")
@@ -213,14 +744,11 @@ def process_oecd_msti():
             mask = (df_rd[unit_col].astype(str).str.contains('USD_PPP', case=False, na=False)) | \
                    (df_rd[unit_col].astype(str).str.contains('FTE', case=False, na=False)) | \
                    (df_rd[unit_col].astype(str).str.contains('HC', case=False, na=False))
-            df_rd = df_rd[mask].copy()
+            df_rd = df_rd[mask]
             print(f"  筛选单位后: {len(df_rd)} 行")
         
-        # 标准化国家名称
-        df_rd = filter_target_countries(df_rd, ref_area_col)
-        
         if len(df_rd) == 0:
-            print(f"  ⚠️  筛选目标国家后无数据")
+            print(f"  ⚠️  筛选单位后无数据")
             return pd.DataFrame(columns=['Country', 'Year', 'GERD_Million_USD', 'Researchers'])
         
         # 重命名列
@@ -236,7 +764,7 @@ def process_oecd_msti():
         # 确保Year和Value是数字
         df_rd['Year'] = pd.to_numeric(df_rd['Year'], errors='coerce')
         df_rd = df_rd[df_rd['Year'].notna()]
-        df_rd['Year'] = df_rd['Year'].astype(int)
+        df_rd['Year'] = df_rd['Year'].astype(YEAR_DTYPE)
         
         df_rd['Value'] = pd.to_numeric(df_rd['Value'], errors='coerce')
         
@@ -250,27 +778,33 @@ def process_oecd_msti():
         else:
             df_rd['Feature'] = 'GERD_Million_USD'  # 默认
         
-        # 透视表
-        df_pivot = df_rd.pivot_table(
-            index=['Country', 'Year'],
-            columns='Feature',
-            values='Value',
-            aggfunc='mean'
-        ).reset_index()
+        # 透视表 (分组聚合后展开；国家为分类类型，分组时使用整数编码)
+        df_pivot = (
+            df_rd.groupby(['Country', 'Year', 'Feature'], observed=True)['Value']
+            .mean()
+            .dropna()
+            .unstack('Feature')
+            .reset_index()
+        )
         
         print(f"  ✓ OECD MSTI 处理完成: {len(df_pivot)} 条记录")
         return df_pivot
         
     except Exception as e:
-        print(f"  ✗ 处理 OECD MSTI 数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        report_exception(f"  ✗ 处理 OECD MSTI 数据时出错: {e}")
         return pd.DataFrame(columns=['Country', 'Year', 'GERD_Million_USD', 'Researchers'])
 
 # =========================
 # 3. 基础设施数据处理
 # =========================
 
+EMBER_COL_PATTERNS = {
+    **COL_PATTERNS,
+    'generation': re.compile(r'(?=.*total)(?=.*(generat|发电))', re.I),
+    'renewables': re.compile(r'(?=.*(renewable|可再生|clean))(?=.*(generation|发电))', re.I),
+}
+
+@cache_df('ember', "基础设施/ember_十国发电量.csv", "基础设施/ember_十国发电量.xlsx")
 def process_ember_electricity():
     """处理Ember电力数据"""
     print("正在处理 Ember 电力数据...")
@@ -284,38 +818,25 @@ def process_ember_electricity():
         return pd.DataFrame(columns=['Country', 'Year', 'Total_Generation_TWh', 'Renewables_Generation_TWh'])
     
     try:
-        df = safe_read_file(filepath)
+        # 先只读表头识别相关列 (包括总发电量和可再生能源发电量列)，再只解析这些列
+        df = safe_read_file(filepath, columns_spec=EMBER_COL_PATTERNS)
         if df is None:
             return pd.DataFrame(columns=['Country', 'Year', 'Total_Generation_TWh', 'Renewables_Generation_TWh'])
         
-        print(f"  列数: {len(df.columns)}, 行数: {len(df)}")
-        print(f"  列名: {df.columns.tolist()}")
-        
-        # 查找相关列
-        country_col = None
-        year_col = None
+        columns = df.attrs.pop('source_columns')
+        cols = identify_columns(df.columns, EMBER_COL_PATTERNS)
         
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if country_col is None and ('country' in col_lower or '国家' in col_lower or 'area' in col_lower or 'entity' in col_lower):
-                country_col = col
-            elif year_col is None and ('year' in col_lower or '年' in col_lower):
-                year_col = col
+        print(f"  列数: {len(columns)}, 行数: {len(df)}")
+        print(f"  列名: {columns}")
         
-        # 查找发电量列
-        generation_cols = []
-        renewables_cols = []
-        
-        for col in df.columns:
-            col_str = str(col).lower()
-            if 'total' in col_str and ('generation' in col_str or 'generat' in col_str or '发电' in col_str):
-                generation_cols.append(col)
-            elif ('renewable' in col_str or '可再生' in col_str or 'clean' in col_str) and ('generation' in col_str or '发电' in col_str):
-                renewables_cols.append(col)
+        country_col = cols['country']
+        year_col = cols['year']
+        generation_col = cols['generation']
+        renewables_col = cols['renewables']
         
         print(f"  识别的列: Country={country_col}, Year={year_col}")
-        print(f"  发电量列: {generation_cols}")
-        print(f"  可再生能源列: {renewables_cols}")
+        print(f"  发电量列: {generation_col}")
+        print(f"  可再生能源列: {renewables_col}")
         
         if not country_col or not year_col:
             print(f"  ⚠️  缺少必需列，跳过Ember")
@@ -330,36 +851,35 @@ def process_ember_electricity():
         
         # 选择列
         result_cols = [country_col, year_col]
-        if generation_cols:
-            result_cols.append(generation_cols[0])
-        if renewables_cols:
-            result_cols.append(renewables_cols[0])
+        if generation_col:
+            result_cols.append(generation_col)
+        if renewables_col:
+            result_cols.append(renewables_col)
         
-        df_result = df[result_cols].copy()
+        df_result = df[result_cols]
         
         # 重命名
         rename_dict = {country_col: 'Country', year_col: 'Year'}
-        if generation_cols:
-            rename_dict[generation_cols[0]] = 'Total_Generation_TWh'
-        if renewables_cols:
-            rename_dict[renewables_cols[0]] = 'Renewables_Generation_TWh'
+        if generation_col:
+            rename_dict[generation_col] = 'Total_Generation_TWh'
+        if renewables_col:
+            rename_dict[renewables_col] = 'Renewables_Generation_TWh'
         
         df_result = df_result.rename(columns=rename_dict)
         
         # 确保Year是整数
         df_result['Year'] = pd.to_numeric(df_result['Year'], errors='coerce')
         df_result = df_result[df_result['Year'].notna()]
-        df_result['Year'] = df_result['Year'].astype(int)
+        df_result['Year'] = df_result['Year'].astype(YEAR_DTYPE)
         
         print(f"  ✓ Ember 电力数据处理完成: {len(df_result)} 条记录")
         return df_result
         
     except Exception as e:
-        print(f"  ✗ 处理 Ember 数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        report_exception(f"  ✗ 处理 Ember 数据时出错: {e}")
         return pd.DataFrame(columns=['Country', 'Year', 'Total_Generation_TWh', 'Renewables_Generation_TWh'])
 
+@cache_df('oecd_broadband', "OECD_宽带与电信.csv", "OECD_宽带与电信.xlsx")
 def process_oecd_broadband():
     """处理OECD宽带数据"""
     print("正在处理 OECD 宽带数据...")
@@ -373,28 +893,20 @@ def process_oecd_broadband():
         return pd.DataFrame(columns=['Country', 'Year', 'Fibre_Percentage'])
     
     try:
-        df = safe_read_file(filepath)
+        # 先只读表头识别列 (OECD格式)，再只解析这些列
+        df = safe_read_file(filepath, columns_spec=COL_PATTERNS)
         if df is None:
             return pd.DataFrame(columns=['Country', 'Year', 'Fibre_Percentage'])
         
-        print(f"  列数: {len(df.columns)}, 行数: {len(df)}")
-        
-        # 查找列 (OECD格式)
-        country_col = None
-        year_col = None
-        value_col = None
-        measure_col = None
-        
-        for col in df.columns:
-            col_str = str(col).upper()
-            if 'REF_AREA' in col_str or col_str == 'COUNTRY':
-                country_col = col
-            elif 'TIME_PERIOD' in col_str or 'TIME' in col_str or col_str == 'YEAR':
-                year_col = col
-            elif 'OBS_VALUE' in col_str or col_str == 'VALUE':
-                value_col = col
-            elif 'MEASURE' in col_str:
-                measure_col = col
+        columns = df.attrs.pop('source_columns')
+        cols = identify_columns(df.columns)
+        
+        print(f"  列数: {len(columns)}, 行数: {len(df)}")
+        
+        country_col = cols['country']
+        year_col = cols['year']
+        value_col = cols['value']
+        measure_col = cols['measure']
         
         print(f"  识别的列: Country={country_col}, Year={year_col}, Value={value_col}, Measure={measure_col}")
         
@@ -402,19 +914,19 @@ def process_oecd_broadband():
             print(f"  ⚠️  缺少必需列，跳过OECD宽带")
             return pd.DataFrame(columns=['Country', 'Year', 'Fibre_Percentage'])
         
-        # 筛选光纤相关数据 (MEASURE可能包含A3F_B, G14_B等代码)
-        # 通常光纤数据的MEASURE包含 'F' 或特定代码
-        df_fibre = df.copy()
+        # 先标准化并筛选目标国家，后续的重命名和聚合只处理目标国家的数据
+        df = filter_target_countries(df, country_col)
         
-        if len(df_fibre) == 0:
-            print(f"  ⚠️  未找到光纤相关数据")
+        if len(df) == 0:
+            print(f"  ⚠️  筛选目标国家后无数据")
             return pd.DataFrame(columns=['Country', 'Year', 'Fibre_Percentage'])
         
-        # 标准化国家名称
-        df_fibre = filter_target_countries(df_fibre, country_col)
+        # 筛选光纤相关数据 (MEASURE可能包含A3F_B, G14_B等代码)
+        # 通常光纤数据的MEASURE包含 'F' 或特定代码
+        df_fibre = df
         
         if len(df_fibre) == 0:
-            print(f"  ⚠️  筛选目标国家后无数据")
+            print(f"  ⚠️  未找到光纤相关数据")
             return pd.DataFrame(columns=['Country', 'Year', 'Fibre_Percentage'])
         
         # 重命名
@@ -424,25 +936,29 @@ def process_oecd_broadband():
             value_col: 'Fibre_Percentage'
         })
         
-        df_result = df_fibre[['Country', 'Year', 'Fibre_Percentage']].copy()
+        df_result = df_fibre[['Country', 'Year', 'Fibre_Percentage']]
         
         # 确保Year是整数
         df_result['Year'] = pd.to_numeric(df_result['Year'], errors='coerce')
         df_result = df_result[df_result['Year'].notna()]
-        df_result['Year'] = df_result['Year'].astype(int)
+        df_result['Year'] = df_result['Year'].astype(YEAR_DTYPE)
         
         # 按国家和年份聚合（取平均值）
-        df_result = df_result.groupby(['Country', 'Year'])['Fibre_Percentage'].mean().reset_index()
+        df_result = df_result.groupby(['Country', 'Year'], observed=True)['Fibre_Percentage'].mean().reset_index()
         
         print(f"  ✓ OECD 宽带数据处理完成: {len(df_result)} 条记录")
         return df_result
         
     except Exception as e:
-        print(f"  ✗ 处理 OECD 宽带数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        report_exception(f"  ✗ 处理 OECD 宽带数据时出错: {e}")
         return pd.DataFrame(columns=['Country', 'Year', 'Fibre_Percentage'])
 
+TOP500_COL_PATTERNS = {
+    **COL_PATTERNS,
+    'rmax': re.compile(r'rmax|performance|性能', re.I),
+}
+
+@cache_df('top500', "基础设施/TOP500  TOP500List(已求和).csv", "基础设施/TOP500  TOP500List(已求和).xlsx")
 def process_top500_compute():
     """处理TOP500计算能力数据"""
     print("正在处理 TOP500 计算能力数据...")
@@ -456,26 +972,20 @@ def process_top500_compute():
         return pd.DataFrame(columns=['Country', 'Year', 'Compute_Power_Rmax'])
     
     try:
-        df = safe_read_file(filepath)
+        # 先只读表头识别列，再只解析这些列
+        df = safe_read_file(filepath, columns_spec=TOP500_COL_PATTERNS)
         if df is None:
             return pd.DataFrame(columns=['Country', 'Year', 'Compute_Power_Rmax'])
         
-        print(f"  列数: {len(df.columns)}, 行数: {len(df)}")
-        print(f"  列名: {df.columns.tolist()}")
+        columns = df.attrs.pop('source_columns')
+        cols = identify_columns(df.columns, TOP500_COL_PATTERNS)
         
-        # 查找列
-        country_col = None
-        year_col = None
-        rmax_col = None
+        print(f"  列数: {len(columns)}, 行数: {len(df)}")
+        print(f"  列名: {columns}")
         
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if country_col is None and ('country' in col_lower or '国家' in col_lower):
-                country_col = col
-            elif year_col is None and ('year' in col_lower or '年' in col_lower):
-                year_col = col
-            elif rmax_col is None and ('rmax' in col_lower or 'performance' in col_lower or '性能' in col_lower):
-                rmax_col = col
+        country_col = cols['country']
+        year_col = cols['year']
+        rmax_col = cols['rmax']
         
         print(f"  识别的列: Country={country_col}, Year={year_col}, Rmax={rmax_col}")
         
@@ -495,20 +1005,20 @@ def process_top500_compute():
             df[rmax_col] = pd.to_numeric(df[rmax_col], errors='coerce')
             df['Year'] = pd.to_numeric(df[year_col], errors='coerce')
             
-            df_grouped = df.groupby([country_col, 'Year'])[rmax_col].sum().reset_index()
+            df_grouped = df.groupby([country_col, 'Year'], observed=True)[rmax_col].sum().reset_index()
             df_grouped = df_grouped.rename(columns={
                 country_col: 'Country',
                 rmax_col: 'Compute_Power_Rmax'
             })
-            df_grouped['Year'] = df_grouped['Year'].astype(int)
+            df_grouped['Year'] = df_grouped['Year'].astype(YEAR_DTYPE)
         elif rmax_col:
             df[rmax_col] = pd.to_numeric(df[rmax_col], errors='coerce')
-            df_grouped = df.groupby(country_col)[rmax_col].sum().reset_index()
+            df_grouped = df.groupby(country_col, observed=True)[rmax_col].sum().reset_index()
             df_grouped = df_grouped.rename(columns={
                 country_col: 'Country',
                 rmax_col: 'Compute_Power_Rmax'
             })
-            df_grouped['Year'] = 2024
+            df_grouped['Year'] = np.int16(2024)
         else:
             print(f"  ⚠️  未找到Rmax列")
             return pd.DataFrame(columns=['Country', 'Year', 'Compute_Power_Rmax'])
@@ -517,15 +1027,71 @@ def process_top500_compute():
         return df_grouped
         
     except Exception as e:
-        print(f"  ✗ 处理 TOP500 数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        report_exception(f"  ✗ 处理 TOP500 数据时出错: {e}")
         return pd.DataFrame(columns=['Country', 'Year', 'Compute_Power_Rmax'])
 
 # =========================
 # 4. Stanford AI Index 数据处理
 # =========================
 
+def _process_ai_index_file(file_path):
+    """
+    读取单个AI Index CSV文件并转换为长格式 (在子进程中运行)
+    文件不含目标国家×年份数据时返回None
+    """
+    try:
+        # 只读表头，检查是否有年份列
+        header = pd.read_csv(file_path, encoding='utf-8', nrows=0)
+        year_cols = [col for col in header.columns if str(col).isdigit() and 2010 <= int(str(col)) <= 2024]
+        if not year_cols:
+            return None
+        
+        # 只读前20行，检查第一列是否包含国家名称
+        df_head = pd.read_csv(file_path, encoding='utf-8', nrows=20)
+        has_country_in_rows = False
+        if len(df_head.columns) > 0 and len(df_head) > 0:
+            first_col_values = df_head.iloc[:, 0].astype(str).tolist()
+            for val in first_col_values:
+                std_name = standardize_country_name(val)
+                if std_name in TARGET_COUNTRY_SET:
+                    has_country_in_rows = True
+                    break
+        
+        if not has_country_in_rows:
+            return None
+        
+        # 两项检查都通过后才读取文件，且只解析国家列和年份列
+        country_col = header.columns[0]
+        df = read_csv_fast(file_path, encoding='utf-8', usecols=[country_col] + year_cols)
+        
+        if len(df) == 0:
+            return None
+        
+        # 先在宽表上标准化并筛选国家，每行只处理一次而不是每个年份各一次
+        countries = standardize_country_series(df[country_col]).astype(COUNTRY_DTYPE)
+        keep = countries.notna().to_numpy()
+        
+        # 相关文件但筛选后无数据时返回空表，由调用方计数
+        if not keep.any():
+            return pd.DataFrame(columns=['Country', 'Year', 'Value', 'Source_File'])
+        
+        # 直接用numpy展开为长格式 (每行的各年份相邻)，代替melt
+        n_years = len(year_cols)
+        values = df.loc[keep, year_cols].to_numpy().ravel()
+        years = np.array([int(col) for col in year_cols], dtype=YEAR_DTYPE)
+        df_long = pd.DataFrame({
+            'Country': pd.Categorical.from_codes(
+                np.repeat(countries.cat.codes.to_numpy()[keep], n_years), dtype=COUNTRY_DTYPE),
+            'Year': np.tile(years, int(keep.sum())),
+            'Value': pd.to_numeric(values, errors='coerce'),
+            'Source_File': os.path.basename(file_path),
+        })
+        return df_long
+        
+    except Exception:
+        return None
+
+@cache_df('stanford_ai_index', "The 2025 AI Index Report/1. Research and Development")
 def process_stanford_ai_index():
     """处理Stanford AI Index数据"""
     print("正在处理 Stanford AI Index 数据...")
@@ -542,58 +1108,23 @@ def process_stanford_ai_index():
         csv_files = [f for f in os.listdir(ai_folder) if f.endswith('.csv')]
         print(f"  找到 {len(csv_files)} 个CSV文件")
         
+        # 各文件相互独立，使用多进程并行读取
+        paths = [os.path.join(ai_folder, f) for f in csv_files]
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = list(executor.map(_process_ai_index_file, paths, chunksize=4))
+        
         relevant_files = 0
         
-        for csv_file in csv_files:
-            file_path = os.path.join(ai_folder, csv_file)
-            
-            try:
-                df = pd.read_csv(file_path, encoding='utf-8')
-                
-                if len(df) == 0:
-                    continue
-                
-                # 检查是否有年份列
-                year_cols = [col for col in df.columns if str(col).isdigit() and 2010 <= int(str(col)) <= 2024]
-                has_year_cols = len(year_cols) > 0
-                
-                # 检查第一列是否包含国家名称
-                has_country_in_rows = False
-                if len(df.columns) > 0 and len(df) > 0:
-                    first_col_values = df.iloc[:, 0].astype(str).tolist()
-                    for val in first_col_values[:20]:
-                        std_name = standardize_country_name(val)
-                        if std_name and std_name in TARGET_COUNTRIES:
-                            has_country_in_rows = True
-                            break
-                
-                if has_country_in_rows and has_year_cols and len(df) > 0:
-                    relevant_files += 1
-                    print(f"  分析文件 [{relevant_files}]: {csv_file}")
-                    
-                    country_col = df.columns[0]
-                    
-                    # 转换为长格式
-                    df_long = df.melt(
-                        id_vars=[country_col],
-                        value_vars=year_cols,
-                        var_name='Year',
-                        value_name='Value'
-                    )
-                    
-                    # 标准化国家名称
-                    df_long['Country'] = df_long[country_col].apply(standardize_country_name)
-                    df_long = df_long[df_long['Country'].isin(TARGET_COUNTRIES)]
-                    
-                    if len(df_long) > 0:
-                        df_long['Year'] = df_long['Year'].astype(int)
-                        df_long['Value'] = pd.to_numeric(df_long['Value'], errors='coerce')
-                        df_long['Source_File'] = csv_file
-                        all_data.append(df_long[['Country', 'Year', 'Value', 'Source_File']])
-                        print(f"    → 提取 {len(df_long)} 条记录")
-                
-            except Exception as e:
+        for csv_file, df_long in zip(csv_files, results):
+            if df_long is None:
                 continue
+            
+            relevant_files += 1
+            print(f"  分析文件 [{relevant_files}]: {csv_file}")
+            
+            if len(df_long) > 0:
+                all_data.append(df_long)
+                print(f"    → 提取 {len(df_long)} 条记录")
         
         print(f"  处理了 {relevant_files} 个相关文件")
         
@@ -619,32 +1150,39 @@ def process_stanford_ai_index():
             else:
                 return 'AI_Metric'
         
-        df_combined['Feature_Type'] = df_combined['Source_File'].apply(classify_feature)
-        
-        # 按国家、年份和特征类型聚合
-        df_grouped = df_combined.groupby(['Country', 'Year', 'Feature_Type'])['Value'].max().reset_index()
+        # 文件名只有几十个，按唯一值分类后映射，而不是对每一行调用
+        feature_types = {f: classify_feature(f) for f in df_combined['Source_File'].unique()}
+        df_combined['Feature_Type'] = df_combined['Source_File'].map(feature_types)
         
-        # 透视表
-        df_pivot = df_grouped.pivot_table(
-            index=['Country', 'Year'],
-            columns='Feature_Type',
-            values='Value',
-            aggfunc='first'
-        ).reset_index()
+        # 按国家、年份和特征类型聚合后展开为宽表
+        df_pivot = (
+            df_combined.groupby(['Country', 'Year', 'Feature_Type'], observed=True)['Value']
+            .max()
+            .dropna()
+            .unstack('Feature_Type')
+            .reset_index()
+        )
         
         print(f"  ✓ Stanford AI Index 数据处理完成: {len(df_pivot)} 条记录")
         return df_pivot
         
     except Exception as e:
-        print(f"  ✗ 处理 Stanford AI Index 数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        report_exception(f"  ✗ 处理 Stanford AI Index 数据时出错: {e}")
         return pd.DataFrame(columns=['Country', 'Year'])
 
 # =========================
 # 5. Tortoise Index 数据处理
 # =========================
 
+# Tortoise Index的列名识别规则
+TORTOISE_COL_PATTERNS = {
+    'country': re.compile(r'country|国家|nation', re.I),
+    'year': re.compile(r'year|年', re.I),
+    'policy': re.compile(r'(?=.*government)(?=.*strategy)|政策|policy', re.I),
+    'commercial': re.compile(r'commercial|商业', re.I),
+}
+
+@cache_df('tortoise', "Tortoise_核心得分.csv", "Tortoise_核心得分.xlsx")
 def process_tortoise_index():
     """处理Tortoise Index数据"""
     print("正在处理 Tortoise Index 数据...")
@@ -658,29 +1196,20 @@ def process_tortoise_index():
         return pd.DataFrame(columns=['Country', 'Year', 'Policy_Score', 'Commercial_Score'])
     
     try:
-        df = safe_read_file(filepath)
+        # 先只读表头识别列，再只解析这些列
+        df = safe_read_file(filepath, columns_spec=TORTOISE_COL_PATTERNS)
         if df is None:
             return pd.DataFrame(columns=['Country', 'Year', 'Policy_Score', 'Commercial_Score'])
         
-        print(f"  列数: {len(df.columns)}, 行数: {len(df)}")
-        print(f"  列名: {df.columns.tolist()}")
-        
-        # 查找列
-        country_col = None
-        year_col = None
-        policy_col = None
-        commercial_col = None
-        
-        for col in df.columns:
-            col_lower = str(col).lower()
-            if country_col is None and ('country' in col_lower or '国家' in col_lower or 'nation' in col_lower):
-                country_col = col
-            elif year_col is None and ('year' in col_lower or '年' in col_lower):
-                year_col = col
-            elif policy_col is None and (('government' in col_lower and 'strategy' in col_lower) or '政策' in col_lower or 'policy' in col_lower):
-                policy_col = col
-            elif commercial_col is None and ('commercial' in col_lower or '商业' in col_lower):
-                commercial_col = col
+        columns = df.attrs.pop('source_columns')
+        print(f"  列数: {len(columns)}, 行数: {len(df)}")
+        print(f"  列名: {columns}")
+        
+        cols = identify_columns(df.columns, TORTOISE_COL_PATTERNS)
+        country_col = cols['country']
+        year_col = cols['year']
+        policy_col = cols['policy']
+        commercial_col = cols['commercial']
         
         print(f"  识别的列: Country={country_col}, Year={year_col}, Policy={policy_col}, Commercial={commercial_col}")
         
@@ -704,7 +1233,7 @@ def process_tortoise_index():
         if commercial_col:
             result_cols.append(commercial_col)
         
-        df_result = df[result_cols].copy()
+        df_result = df[result_cols]
         
         # 重命名
         rename_dict = {country_col: 'Country'}
@@ -719,19 +1248,17 @@ def process_tortoise_index():
         
         # 如果没有年份列，假设是2024年数据
         if 'Year' not in df_result.columns:
-            df_result['Year'] = 2024
+            df_result['Year'] = np.int16(2024)
         else:
             df_result['Year'] = pd.to_numeric(df_result['Year'], errors='coerce')
             df_result = df_result[df_result['Year'].notna()]
-            df_result['Year'] = df_result['Year'].astype(int)
+            df_result['Year'] = df_result['Year'].astype(YEAR_DTYPE)
         
         print(f"  ✓ Tortoise Index 数据处理完成: {len(df_result)} 条记录")
         return df_result
         
     except Exception as e:
-        print(f"  ✗ 处理 Tortoise Index 数据时出错: {e}")
-        import traceback
-        traceback.print_exc()
+        report_exception(f"  ✗ 处理 Tortoise Index 数据时出错: {e}")
         return pd.DataFrame(columns=['Country', 'Year', 'Policy_Score', 'Commercial_Score'])
 
 # =========================
@@ -740,72 +1267,170 @@ def process_tortoise_index():
 
 def merge_all_data(df_list):
     """合并所有数据框"""
-    print("\n正在合并所有数据...")
+    log("\n正在合并所有数据...")
     
-    df_merged = None
+    # 各数据源以 (Country, Year) 为索引，一次外连接对齐，而不是逐个merge
+    # 国家统一为同一分类类型，对齐时比较整数编码，结果也保持分类类型
+    indexed = []
     for name, df in df_list:
         if df is not None and len(df) > 0:
-            if df_merged is None:
-                df_merged = df
-            else:
-                df_merged = pd.merge(df_merged, df, on=['Country', 'Year'], how='outer')
-    
-    if df_merged is None or len(df_merged) == 0:
+            df = df.assign(Country=df['Country'].astype(COUNTRY_DTYPE)).set_index(['Country', 'Year'])
+            if df.index.has_duplicates:
+                # 索引对齐要求键唯一: 同一国家-年份的多条记录取平均值
+                print(f"  ⚠️  {name}: 存在重复的国家-年份记录，取平均值")
+                df = df.groupby(level=['Country', 'Year'], observed=True).mean(numeric_only=True)
+            indexed.append(df)
+    
+    if not indexed:
         print("  ⚠️  没有有效数据可合并")
         return pd.DataFrame()
     
+    df_merged = pd.concat(indexed, axis=1, join='outer').reset_index()
+    
     # 确保Year是整数
     df_merged['Year'] = df_merged['Year'].astype(int)
     
     # 排序
     df_merged = df_merged.sort_values(['Country', 'Year']).reset_index(drop=True)
     
-    print(f"  ✓ 合并完成: {len(df_merged)} 条记录, {len(df_merged.columns)-2} 个特征")
+    log(f"  ✓ 合并完成: {len(df_merged)} 条记录, {len(df_merged.columns)-2} 个特征")
     return df_merged
 
+def downcast_numeric(df):
+    """
+    缩小合并结果的数值类型: Year转为int16，float64列在不损失精度时转为float32
+    (只转换能被float32精确表示的列，如整数得分，保存的结果不变)
+    """
+    df['Year'] = df['Year'].astype(YEAR_DTYPE)
+    for col in df.select_dtypes(include=['float64']).columns:
+        values = df[col].to_numpy()
+        downcast = values.astype(np.float32)
+        if np.array_equal(downcast.astype(np.float64), values, equal_nan=True):
+            df[col] = downcast
+    return df
+
+def _fill_linear_numpy(values, starts, ends):
+    """
+    按分组 [starts[g], ends[g]) 对二维数组的每列做线性插值，两端用最近的有效值填充
+    (等价于 interpolate(method='linear', limit_direction='both'))
+    """
+    out = values.copy()
+    for start, end in zip(starts, ends):
+        block = out[start:end]
+        x = np.arange(end - start)
+        for j in range(block.shape[1]):
+            col = block[:, j]
+            valid = ~np.isnan(col)
+            if valid.any() and not valid.all():
+                block[:, j] = np.interp(x, x[valid], col[valid])
+    return out
+
+@functools.lru_cache(maxsize=None)
+def _numba_fill_kernel():
+    """首次需要时才导入numba并构建JIT内核"""
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def kernel(values, starts, ends):
+        out = values.copy()
+        for j in prange(values.shape[1]):
+            for g in range(len(starts)):
+                start, end = starts[g], ends[g]
+                last = -1
+                for i in range(start, end):
+                    v = values[i, j]
+                    if np.isnan(v):
+                        continue
+                    if last < 0:
+                        # 开头的缺失值用第一个有效值填充
+                        for k in range(start, i):
+                            out[k, j] = v
+                    elif i - last > 1:
+                        step = (v - values[last, j]) / (i - last)
+                        for k in range(last + 1, i):
+                            out[k, j] = values[last, j] + step * (k - last)
+                    last = i
+                # 结尾的缺失值用最后一个有效值填充
+                if last >= 0:
+                    for k in range(last + 1, end):
+                        out[k, j] = values[last, j]
+        return out
+
+    return kernel
+
+def _fill_linear_numba(values, starts, ends):
+    """与 _fill_linear_numpy 相同，各列并行，每列每组只顺序扫描一遍"""
+    return _numba_fill_kernel()(values, starts, ends)
+
+# 分组数 × 列数超过该值时才使用numba内核: numpy版本的耗时与 (分组, 列) 的个数成正比，
+# 小数据时远小于numba的导入和加载编译缓存的开销 (本仓库的面板 141×5 只需约0.25毫秒)
+NUMBA_MIN_BLOCKS = 50000
+
+def fill_linear(values, starts, ends):
+    """按数据量选择插值内核，默认使用numpy版本"""
+    if HAS_NUMBA and len(starts) * values.shape[1] >= NUMBA_MIN_BLOCKS:
+        return _fill_linear_numba(values, starts, ends)
+    return _fill_linear_numpy(values, starts, ends)
+
 def interpolate_missing_years(df):
     """对缺失年份进行线性插值"""
-    print("\n正在进行线性插值...")
-    
-    df_interpolated_list = []
+    log("\n正在进行线性插值...")
     
-    for country in TARGET_COUNTRIES:
-        df_country = df[df['Country'] == country].copy()
-        
-        if len(df_country) == 0:
-            continue
-        
-        min_year = df_country['Year'].min()
-        max_year = df_country['Year'].max()
-        
-        # 创建完整的年份范围
-        full_years = pd.DataFrame({'Year': range(min_year, max_year + 1)})
-        
-        # 合并并插值
-        df_country_full = pd.merge(full_years, df_country, on='Year', how='left')
-        df_country_full['Country'] = country
-        
-        # 对数值列进行线性插值
-        numeric_cols = df_country_full.select_dtypes(include=[np.number]).columns
-        numeric_cols = [col for col in numeric_cols if col != 'Year']
-        
-        for col in numeric_cols:
-            df_country_full[col] = df_country_full[col].interpolate(method='linear', limit_direction='both')
-        
-        df_interpolated_list.append(df_country_full)
+    df_target = df[df['Country'].isin(TARGET_COUNTRY_SET)]
     
-    if not df_interpolated_list:
+    if len(df_target) == 0:
         print("  ⚠️  插值失败，无数据")
         return df
     
-    df_interpolated = pd.concat(df_interpolated_list, ignore_index=True)
-    
-    print(f"  ✓ 插值完成: {len(df_interpolated)} 条记录")
-    return df_interpolated
+    # 国家列使用分类类型: 分组和输出都基于整数编码
+    df_target = df_target.assign(Country=df_target['Country'].astype(COUNTRY_DTYPE))
+    
+    key_cols = ['Country', 'Year']
+    feature_cols = [col for col in df_target.columns if col not in key_cols]
+    numeric_cols = [col for col in df_target.select_dtypes(include=[np.number]).columns if col != 'Year']
+    
+    if df_target.duplicated(key_cols).any():
+        # 输出中每个 (国家, 年份) 只占一行: 重复记录的数值取平均值，其余列取第一个值
+        df_target = df_target.groupby(key_cols, observed=True, as_index=False).agg(
+            {col: 'mean' if col in numeric_cols else 'first' for col in feature_cols})
+    
+    # 每个国家的年份范围，决定它在输出中占用的连续行 [offsets, offsets + sizes)
+    # 分组只计算一次: 年份范围和每条记录所属的组号都来自同一个groupby
+    grouped = df_target.groupby('Country', sort=False, observed=True)
+    ranges = grouped['Year'].agg(['min', 'max'])
+    mins = ranges['min'].to_numpy(dtype=np.int64)
+    sizes = ranges['max'].to_numpy(dtype=np.int64) - mins + 1
+    offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    total = int(sizes.sum())
+    
+    # 每条记录的输出行号 = 所在国家的起始行 + (年份 - 该国最早年份)
+    group = grouped.ngroup().to_numpy()
+    positions = offsets[group] + df_target['Year'].to_numpy(dtype=np.int64) - mins[group]
+    
+    # 数值列散布到预分配的二维数组中 (缺失年份为NaN)，再一次性插值
+    buffer = np.full((total, len(numeric_cols)), np.nan)
+    buffer[positions] = df_target[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    complete = ~np.isnan(buffer).any(axis=0)
+    buffer = fill_linear(buffer, offsets, offsets + sizes)
+    
+    df_full = pd.DataFrame({
+        'Country': pd.Categorical.from_codes(np.repeat(ranges.index.codes, sizes), dtype=COUNTRY_DTYPE),
+        'Year': np.arange(total) - np.repeat(offsets - mins, sizes),
+    })
+    for j, col in enumerate(numeric_cols):
+        # 没有缺失的列保持原来的类型 (如整数列)
+        df_full[col] = buffer[:, j] if not complete[j] else buffer[:, j].astype(df_target[col].dtype)
+    for col in feature_cols:
+        if col not in numeric_cols:
+            df_full[col] = pd.Series(df_target[col].to_numpy(), index=positions).reindex(np.arange(total)).to_numpy()
+    df_full = df_full[key_cols + feature_cols]
+    
+    log(f"  ✓ 插值完成: {len(df_full)} 条记录")
+    return df_full
 
 def impute_with_commercial_score(df):
     """使用Commercial Score填补缺失值"""
-    print("\n使用 Commercial Score 填补缺失值...")
+    log("\n使用 Commercial Score 填补缺失值...")
     
     if 'Commercial_Score' not in df.columns:
         print("  ⚠️  Commercial_Score列不存在，跳过填补")
@@ -819,13 +1444,13 @@ def impute_with_commercial_score(df):
             break
     
     if business_col:
-        for country in ['China', 'India', 'United Arab Emirates']:
-            mask = (df['Country'] == country) & (df[business_col].isna())
-            df.loc[mask, business_col] = df.loc[mask, 'Commercial_Score']
-        print(f"  ✓ 已使用 Commercial_Score 填补 {business_col}")
+        # 一次构建所有待填补国家的掩码，只做一次赋值
+        mask = df['Country'].isin({'China', 'India', 'United Arab Emirates'}) & df[business_col].isna()
+        df.loc[mask, business_col] = df.loc[mask, 'Commercial_Score'].to_numpy()
+        log(f"  ✓ 已使用 Commercial_Score 填补 {business_col}")
     else:
         df['Business_AI_Adoption'] = df['Commercial_Score']
-        print("  ✓ 创建了 Business_AI_Adoption 列")
+        log("  ✓ 创建了 Business_AI_Adoption 列")
     
     return df
 
@@ -833,48 +1458,62 @@ def impute_with_commercial_score(df):
 # 7. 主函数
 # =========================
 
+def _run_source(func):
+    """
+    在子进程中运行一个数据源处理函数
+    它的输出被捕获后一起返回，由主进程按数据源顺序打印，各数据源的日志不会交错
+    """
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        df = func()
+    return df, out.getvalue(), err.getvalue()
+
 def main():
     """主函数"""
-    print("=" * 80)
-    print(" " * 20 + "数据处理流程开始")
-    print("=" * 80)
-    print(f"\n工作目录: {os.getcwd()}\n")
+    log("=" * 80)
+    log(" " * 20 + "数据处理流程开始")
+    log("=" * 80)
+    log(f"\n工作目录: {os.getcwd()}\n")
     
     # 处理各个数据源
-    print("\n" + "-" * 80)
-    print("步骤 1/6: 处理各个数据源")
-    print("-" * 80)
+    log("\n" + "-" * 80)
+    log("步骤 1/6: 处理各个数据源")
+    log("-" * 80)
+    
+    sources = [
+        ('OECD MSTI', process_oecd_msti),
+        ('Ember', process_ember_electricity),
+        ('OECD Broadband', process_oecd_broadband),
+        ('TOP500', process_top500_compute),
+        ('Stanford AI', process_stanford_ai_index),
+        ('Tortoise', process_tortoise_index)
+    ]
     
-    df_oecd_msti = process_oecd_msti()
-    df_ember = process_ember_electricity()
-    df_broadband = process_oecd_broadband()
-    df_top500 = process_top500_compute()
-    df_stanford = process_stanford_ai_index()
-    df_tortoise = process_tortoise_index()
+    # 各数据源相互独立，在多个进程中并行处理 (解析是CPU密集的，线程受GIL限制)
+    # 按上面的顺序收集结果并打印各自的日志
+    all_dataframes = []
+    with ProcessPoolExecutor(max_workers=len(sources)) as executor:
+        futures = [executor.submit(_run_source, func) for _, func in sources]
+        for (name, _), future in zip(sources, futures):
+            df, out, err = future.result()
+            sys.stdout.write(out)
+            sys.stderr.write(err)
+            all_dataframes.append((name, df))
     
     # 合并所有数据
-    print("\n" + "-" * 80)
-    print("步骤 2/6: 合并所有数据源")
-    print("-" * 80)
-    
-    all_dataframes = [
-        ('OECD MSTI', df_oecd_msti),
-        ('Ember', df_ember),
-        ('OECD Broadband', df_broadband),
-        ('TOP500', df_top500),
-        ('Stanford AI', df_stanford),
-        ('Tortoise', df_tortoise)
-    ]
+    log("\n" + "-" * 80)
+    log("步骤 2/6: 合并所有数据源")
+    log("-" * 80)
     
-    print("\n数据源统计:")
+    log("\n数据源统计:")
     for name, df in all_dataframes:
         if df is not None and len(df) > 0:
             years = df['Year'].unique() if 'Year' in df.columns else []
             year_range = f"{min(years)}-{max(years)}" if len(years) > 0 else "N/A"
             features = [c for c in df.columns if c not in ['Country', 'Year']]
-            print(f"  {name:20s}: {len(df):4d} 条记录, 年份: {year_range:10s}, 特征: {len(features)}")
+            log(f"  {name:20s}: {len(df):4d} 条记录, 年份: {year_range:10s}, 特征: {len(features)}")
         else:
-            print(f"  {name:20s}: 无数据")
+            log(f"  {name:20s}: 无数据")
     
     df_merged = merge_all_data(all_dataframes)
     
@@ -882,66 +1521,82 @@ def main():
         print("\n❌ 错误: 没有数据可处理")
         return
     
+    # 插值前缩小数值类型，减少插值时读写的数据量
+    df_merged = downcast_numeric(df_merged)
+    
     # 线性插值
-    print("\n" + "-" * 80)
-    print("步骤 3/6: 线性插值填补缺失年份")
-    print("-" * 80)
+    log("\n" + "-" * 80)
+    log("步骤 3/6: 线性插值填补缺失年份")
+    log("-" * 80)
     df_interpolated = interpolate_missing_years(df_merged)
     
     # 使用Commercial Score填补缺失值
-    print("\n" + "-" * 80)
-    print("步骤 4/6: 使用Commercial Score填补缺失值")
-    print("-" * 80)
+    log("\n" + "-" * 80)
+    log("步骤 4/6: 使用Commercial Score填补缺失值")
+    log("-" * 80)
     df_final = impute_with_commercial_score(df_interpolated)
     
     # 设置MultiIndex
-    print("\n" + "-" * 80)
-    print("步骤 5/6: 设置MultiIndex")
-    print("-" * 80)
+    log("\n" + "-" * 80)
+    log("步骤 5/6: 设置MultiIndex")
+    log("-" * 80)
     df_final = df_final.set_index(['Country', 'Year']).sort_index()
-    print(f"  ✓ MultiIndex设置完成")
+    log(f"  ✓ MultiIndex设置完成")
     
     # 保存结果
-    print("\n" + "-" * 80)
-    print("步骤 6/6: 保存结果")
-    print("-" * 80)
+    log("\n" + "-" * 80)
+    log("步骤 6/6: 保存结果")
+    log("-" * 80)
     output_file = 'final_model_data.csv'
     df_final.to_csv(output_file, encoding='utf-8-sig')
-    print(f"  ✓ 已保存到: {output_file}")
-    
-    # 统计报告
-    print("\n" + "=" * 80)
-    print(" " * 25 + "处理完成!")
-    print("=" * 80)
-    
-    print(f"\n📊 数据维度: {df_final.shape[0]} 行 × {df_final.shape[1]} 列")
-    
-    countries = df_final.index.get_level_values('Country').unique().tolist()
-    print(f"\n🌍 包含国家 ({len(countries)}):")
-    for i in range(0, len(countries), 3):
-        print(f"   {', '.join(countries[i:i+3])}")
-    
-    years = df_final.index.get_level_values('Year').unique()
-    print(f"\n📅 年份范围: {min(years)} - {max(years)} (共{len(years)}年)")
-    
-    features = df_final.columns.tolist()
-    print(f"\n📈 特征列 ({len(features)}):")
-    for i, feat in enumerate(features, 1):
-        non_null = df_final[feat].notna().sum()
-        completeness = (non_null / len(df_final)) * 100
-        print(f"   {i:2d}. {feat:30s} - {non_null:4d}/{len(df_final):4d} ({completeness:5.1f}% 完整)")
-    
-    print("\n" + "-" * 80)
-    print("缺失值统计:")
-    print("-" * 80)
-    missing = df_final.isnull().sum()
-    missing_pct = (missing / len(df_final)) * 100
-    for feat in features:
-        print(f"  {feat:30s}: {missing[feat]:4d} ({missing_pct[feat]:5.1f}%)")
-    
-    print("\n" + "=" * 80)
+    log(f"  ✓ 已保存到: {output_file}")
+    
+    # 同时保存Parquet格式 (带类型的列式存储，后续分析可直接 pd.read_parquet)
+    if HAS_PYARROW:
+        parquet_file = 'final_model_data.parquet'
+        try:
+            df_final.to_parquet(parquet_file, compression='snappy')
+            log(f"  ✓ 已保存到: {parquet_file}")
+        except Exception as e:
+            print(f"  ⚠️  保存Parquet失败: {e}")
+    
+    # 统计报告 (拼接为一个字符串后一次输出)
+    if VERBOSE:
+        report = ["\n" + "=" * 80, " " * 25 + "处理完成!", "=" * 80]
+        
+        report.append(f"\n📊 数据维度: {df_final.shape[0]} 行 × {df_final.shape[1]} 列")
+        
+        countries = df_final.index.get_level_values('Country').unique().tolist()
+        report.append(f"\n🌍 包含国家 ({len(countries)}):")
+        for i in range(0, len(countries), 3):
+            report.append(f"   {', '.join(countries[i:i+3])}")
+        
+        years = df_final.index.get_level_values('Year').unique()
+        report.append(f"\n📅 年份范围: {min(years)} - {max(years)} (共{len(years)}年)")
+        
+        # 非空数和缺失数都来自一次 count()
+        features = df_final.columns.tolist()
+        n = len(df_final)
+        counts = df_final.count().to_numpy()
+        completeness = (counts / n) * 100
+        missing = n - counts
+        missing_pct = (missing / n) * 100
+        
+        report.append(f"\n📈 特征列 ({len(features)}):")
+        report.extend(f"   {i:2d}. {feat:30s} - {non_null:4d}/{n:4d} ({pct:5.1f}% 完整)"
+                      for i, (feat, non_null, pct) in enumerate(zip(features, counts, completeness), 1))
+        
+        report += ["\n" + "-" * 80, "缺失值统计:", "-" * 80]
+        report.extend(f"  {feat:30s}: {miss:4d} ({pct:5.1f}%)"
+                      for feat, miss, pct in zip(features, missing, missing_pct))
+        
+        log("\n".join(report))
+    else:
+        print(df_final.describe().to_string())
+    
+    log("\n" + "=" * 80)
     print(f"✅ 最终文件已保存: {output_file}")
-    print("=" * 80 + "\n")
+    log("=" * 80 + "\n")
 
 if __name__ == "__main__":
     main()
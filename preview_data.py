@@ -7,6 +7,8 @@
 import pandas as pd
 import os
 
+from csv_utils import read_csv_fast
+
 def preview_oecd_msti():
     """预览OECD MSTI数据"""
     print("=" * 80)
@@ -19,15 +21,18 @@ def preview_oecd_msti():
         print("文件不存在!")
         return
     
-    # 读取数据
-    df = pd.read_csv(filepath, encoding='utf-8')
+    # 先只读表头，再只解析下面分析的关键列
+    columns = pd.read_csv(filepath, encoding='utf-8', nrows=0).columns.tolist()
+    key_cols = [col for col in columns
+                if any(key in str(col).upper() for key in ('REF_AREA', 'TIME', 'MEASURE', 'OBS_VALUE'))]
+    df = read_csv_fast(filepath, encoding='utf-8', usecols=key_cols or None)
     
     print(f"\n基本信息:")
     print(f"  总行数: {len(df)}")
-    print(f"  总列数: {len(df.columns)}")
+    print(f"  总列数: {len(columns)}")
     
     print(f"\n所有列名:")
-    for i, col in enumerate(df.columns, 1):
+    for i, col in enumerate(columns, 1):
         print(f"  {i:2d}. {col}")
     
     # 查找关键列
@@ -69,7 +74,7 @@ def preview_oecd_msti():
         sample_cols = [ref_area_col, time_col, measure_col, value_col]
         print(df[sample_cols].head(10).to_string(index=False))
     else:
-        print(df.head(10).to_string(index=False))
+        print(pd.read_csv(filepath, encoding='utf-8', nrows=10).to_string(index=False))
     
     # 筛选示例
     if measure_col:
@@ -114,20 +119,20 @@ def preview_broadband():
         print("文件不存在!")
         return
     
-    df = pd.read_csv(filepath, encoding='utf-8')
+    # 先只读表头查找MEASURE列，再只解析这一列 (没有时解析第一列用于统计行数)
+    columns = pd.read_csv(filepath, encoding='utf-8', nrows=0).columns.tolist()
+    measure_col = next((col for col in columns if 'MEASURE' in str(col).upper()), None)
+    df = read_csv_fast(filepath, encoding='utf-8', usecols=[measure_col or columns[0]])
     
     print(f"\n基本信息:")
     print(f"  总行数: {len(df)}")
-    print(f"  总列数: {len(df.columns)}")
+    print(f"  总列数: {len(columns)}")
     
-    # 查找MEASURE列
-    for col in df.columns:
-        if 'MEASURE' in str(col).upper():
-            print(f"\nMEASURE类型:")
-            measure_counts = df[col].value_counts()
-            for measure, count in list(measure_counts.items())[:15]:
-                print(f"  {measure:20s}: {count:4d} 条")
-            break
+    if measure_col:
+        print(f"\nMEASURE类型:")
+        measure_counts = df[measure_col].value_counts()
+        for measure, count in list(measure_counts.items())[:15]:
+            print(f"  {measure:20s}: {count:4d} 条")
 
 if __name__ == "__main__":
     preview_oecd_msti()
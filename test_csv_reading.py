@@ -7,6 +7,11 @@
 import pandas as pd
 import os
 
+from csv_utils import read_csv_fast
+
+# 需要检查的关键列 (国家、年份、数值)
+KEY_COL_KEYWORDS = ('REF_AREA', 'COUNTRY', 'TIME', 'YEAR', 'VALUE')
+
 def test_read_csv_files():
     """测试读取CSV文件"""
     print("=" * 60)
@@ -28,19 +33,22 @@ def test_read_csv_files():
             continue
         
         try:
-            # 尝试不同编码读取
+            # 尝试不同编码读取: 先只读表头，再只解析前10列中下面要检查的关键列
             df = None
             for encoding in ['utf-8', 'utf-8-sig', 'gbk', 'gb2312']:
                 try:
-                    df = pd.read_csv(filepath, encoding=encoding)
+                    columns = pd.read_csv(filepath, encoding=encoding, nrows=0).columns.tolist()
+                    key_cols = [col for col in columns[:10]
+                                if any(key in str(col).upper() for key in KEY_COL_KEYWORDS)]
+                    df = read_csv_fast(filepath, encoding=encoding, usecols=key_cols or None)
                     print(f"  ✓ 成功读取 (编码: {encoding})")
                     break
                 except:
                     continue
             
             if df is not None:
-                print(f"  形状: {df.shape}")
-                print(f"  列名 (前5个): {df.columns.tolist()[:5]}")
+                print(f"  形状: {(len(df), len(columns))}")
+                print(f"  列名 (前5个): {columns[:5]}")
                 
                 # 查找关键列
                 for col in df.columns[:10]:
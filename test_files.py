@@ -6,6 +6,14 @@
 import pandas as pd
 import os
 
+# 可选: Rust实现的calamine引擎 (需要 pandas >= 2.2 和 python-calamine)，否则使用默认引擎
+try:
+    import python_calamine  # noqa: F401
+    use_calamine = tuple(int(x) for x in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    use_calamine = False
+EXCEL_ENGINE = 'calamine' if use_calamine else None
+
 print("当前工作目录:", os.getcwd())
 print("\n检查文件存在性:")
 
@@ -24,7 +32,7 @@ for f in files_to_check:
 # 测试读取第一个文件
 print("\n\n尝试读取OECD MSTI文件...")
 try:
-    df = pd.read_excel("OECD_MSTI, 主要科技指标.xlsx")
+    df = pd.read_excel("OECD_MSTI, 主要科技指标.xlsx", engine=EXCEL_ENGINE)
     print(f"成功! 形状: {df.shape}")
     print(f"列名: {df.columns.tolist()}")
     print(f"\n前5行:")